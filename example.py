@@ -1,4 +1,5 @@
 from proxy import proxy
+from typing import Callable
 import time
 
 # The actual implementation of the database connection
@@ -18,14 +19,17 @@ class Database:
 # Define a proxy class that alters the behavior of Database
 @proxy(Database)
 class DatabasePerformanceTracer(Database): # Inheritance is just to get completions, and removed by the proxy.
+    _execute_query_orig: Callable[[str], str]
+
     def __init__(self):
         self.total_time = 0
+        # Note: proxy.bind(Database, self, name) caches the original Database method as `self._<name>_orig`
+        proxy.bind(Database, self, 'execute_query')
 
     def execute_query(self, query: str) -> str:
         print(f"[PERF_TRACE]: before execute {query}")
         start_time = time.perf_counter()
-        # Note: proxy.get(Database, self) retrieves the original Database instance
-        result = proxy.get(Database, self).execute_query(query)
+        result = self._execute_query_orig(query)
         end_time = time.perf_counter()
         elapsed_time = (end_time - start_time) * 1000 # in milliseconds
         print(f"[PERF_TRACE]: after execute {query}, query took {elapsed_time:.2f}ms")
@@ -1,6 +1,81 @@
 # pyright: strict
 
-from typing import Callable, Any
+from typing import Callable, Iterable, Any
+import types
+import weakref
+
+_type_dir_cache: weakref.WeakKeyDictionary[type, frozenset[str]] = weakref.WeakKeyDictionary()
+
+# The names of the methods cached by `proxy.bind`, by the `id` of the proxy class. This is a plain
+# dictionary rather than a weak one, as `proxy.set` looks it up on every call; entries are removed
+# when their class is collected.
+_bound_names: dict[int, set[str]] = {}
+
+# Module-level aliases, which are cheaper to reach than `object` attributes on each construction.
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+def _type_dir(type_: type) -> frozenset[str]:
+    """
+    Returns the members of `type_` like `dir`, computed once per type.
+    """
+    type_dir = _type_dir_cache.get(type_)
+    if type_dir is None:
+        type_dir = _type_dir_cache[type_] = frozenset(dir(type_))
+    return type_dir
+
+def _object_dir(obj: object) -> Iterable[str]:
+    """
+    Returns the members of `obj` like `dir`, reusing the cached members of its
+    type when the type does not customize `__dir__`.
+    """
+    type_ = type(obj)
+    if type_.__dir__ is not object.__dir__:
+        return dir(obj)
+    return _type_dir(type_).union(getattr(obj, '__dict__', ()))
+
+def _getattr(self: Any, name: str) -> Any:
+    """
+    The `__getattr__` of proxy classes, delegating to the proxied object.
+    """
+    if name == '_proxied':
+        raise AttributeError(name)
+    return getattr(self._proxied, name)
+
+def _make_getattr(cls: type) -> Callable[..., Any]:
+    """
+    Returns `_getattr` for the proxy class of `cls`. Each proxy class gets its own
+    copy of the code, so that the interpreter specializes it for that class rather
+    than sharing the specialization with every other proxy class.
+    """
+    code = _getattr.__code__.replace(co_name='__getattr__', co_qualname=f'{cls.__qualname__}.__getattr__')
+    return types.FunctionType(code, _getattr.__globals__)
+
+def _no_init(self: Any, *args: Any, **kwargs: Any):
+    """
+    The `__init__` of proxy classes without an `__init__` of their own, which
+    keeps the proxied type's `__init__` from running on the proxy. It ignores
+    the construction arguments, and `proxy.create` does not call it at all.
+    """
+
+def _rebind(proxy: Any, names: set[str], proxied: Any):
+    """
+    Sets the proxied object of a proxy instance on which `proxy.bind` cached
+    methods, rebinding those methods from the previous proxied object to the new
+    one, and dropping those that the new one does not have.
+    """
+    previous = getattr(proxy, '_proxied', None)
+    _object_setattr(proxy, '_proxied', proxied)
+    cache = proxy.__dict__
+    for name in names:
+        key = f'_{name}_orig'
+        method = cache.get(key)
+        if method is not None and getattr(method, '__self__', None) is previous:
+            method = getattr(proxied, name, None)
+            if method is None:
+                del cache[key]
+            else:
+                cache[key] = method
 
 class Proxy:
     """
@@ -10,41 +85,72 @@ class Proxy:
     with LSP autocompletions.
     """
     @staticmethod
-    def __call__[ProxyType, Proxied](proxied: type[Proxied]) -> Callable[[type[ProxyType]], type[ProxyType]]:
-        def make_proxy(cls: type[ProxyType]) -> type[ProxyType]:
-            class meta(type(cls)): # type: ignore [misc] # pyright: ignore [reportUntypedBaseClass]
-                def __dir__(self):
-                    combined_members = set(dir(cls))
-                    combined_members.update(dir(proxied))
-                    return list(combined_members)
-
-            def new(cls: type[ProxyType], *args: Any, **kwargs: Any) -> ProxyType:
-                proxy = super(cls, cls).__new__(cls) # type: ignore [misc]
-                proxy._proxied = None # type: ignore [attr-defined] # pyright: ignore [reportAttributeAccessIssue]
-                return proxy
+    def __call__[ProxyType, Proxied](proxied: type[Proxied], slots: bool = False) -> Callable[[type[ProxyType]], type[ProxyType]]:
+        """
+        Creates a decorator that turns a class into a proxy for `proxied`.
 
-            def init(self: ProxyType, *args: Any, **kwargs: Any):
-                if cls.__init__ is not proxied.__init__:
-                    cls.__init__(self, *args, **kwargs)
+        Args:
+            proxied: The type of the objects to be proxied.
+            slots: Store the proxied object in a slot instead of the instance `__dict__`.
+                Proxy instances then have no `__dict__`, so the proxy class must declare
+                any attributes of its own in `__slots__`.
 
-            def get(self: ProxyType, name: str):
-                return getattr(self._proxied, name) # type: ignore [attr-defined] # pyright: ignore [reportUnknownMemberType, reportAttributeAccessIssue, reportUnknownArgumentType]
+        Returns:
+            A class decorator producing the proxy class.
+        """
+        def make_proxy(cls: type[ProxyType]) -> type[ProxyType]:
+            class_dir = frozenset(dir(cls)).union(dir(proxied))
 
             def dir_(self: ProxyType):
-                combined_members = set(dir(cls))
-                combined_members.update(self.__dict__.keys())
-                combined_members.update(dir(self._proxied)) # type: ignore [attr-defined] # pyright: ignore [reportUnknownMemberType, reportAttributeAccessIssue, reportUnknownArgumentType]
-                return list(combined_members)
+                type_ = type(self)
+                # A proxy constructed directly has no proxied object until `proxy.set`.
+                members = class_dir.union(_type_dir(type_), _object_dir(getattr(self, '_proxied', None)))
+                if type_.__dictoffset__:
+                    # Read `__dict__` without falling back to the proxied object's through `__getattr__`.
+                    members = members.union(object.__getattribute__(self, '__dict__'))
+                return members
 
-            bases = tuple(b for b in cls.__bases__ if b is not proxied)
+            bases = cls.__bases__
+            if proxied in bases:
+                bases = tuple(b for b in bases if b is not proxied)
             members = {k: v for k, v in cls.__dict__.items() if k not in ('__dict__', '__weakref__')}
+            if slots:
+                own_slots = cls.__dict__.get('__slots__', ())
+                own_slots = (own_slots,) if isinstance(own_slots, str) else tuple(own_slots)
+                for name in own_slots:
+                    members.pop(name, None)
+                members['__slots__'] = ('_proxied', *own_slots)
+
+            # A custom `__new__` would receive the constructor arguments meant for `__init__`, so it
+            # is replaced by one that creates the instance through the bases without them.
+            if '__new__' in members or any(base.__new__ is not object.__new__ for base in bases):
+                def new(cls: type[ProxyType], *args: Any, **kwargs: Any) -> ProxyType:
+                    return super(proxy_cls, cls).__new__(cls) # type: ignore [misc]
+                members['__new__'] = new
+
+            # Whether the class has an `__init__` of its own is decided once, rather than on
+            # every construction.
+            if cls.__init__ is proxied.__init__:
+                members['__init__'] = _no_init
+
             members.update({
-                '__new__': new,
-                '__init__': init,
-                '__getattr__': get,
+                '__getattr__': _make_getattr(cls),
                 '__dir__': dir_,
             })
-            return meta(cls.__name__, bases, members) # type: ignore [return-value] # pyright: ignore [reportReturnType]
+
+            # `dir()` of a class only lists what the class and its bases define. A metaclass
+            # providing `__dir__` is only needed when that misses members of `proxied`, which
+            # instances of the proxy class resolve through `__getattr__`.
+            metaclass: Any = type(cls) # pyright: ignore [reportUnknownVariableType]
+            layout = members.get('__slots__', ('__dict__', '__weakref__'))
+            layout = (layout,) if isinstance(layout, str) else layout
+            if not class_dir <= frozenset(members).union(layout, *map(dir, bases or (object,))):
+                class meta(metaclass):
+                    def __dir__(self):
+                        return class_dir
+                metaclass = meta
+            proxy_cls = metaclass(cls.__name__, bases, members)
+            return proxy_cls
         return make_proxy
 
     @staticmethod
@@ -63,10 +169,22 @@ class Proxy:
         Returns:
             An instance of the proxy class.
         """
-        proxy_obj = object.__new__(proxy)
-        Proxy.set(proxy_obj, proxied)
-        proxy_obj.__init__(*args, **kwargs) # type: ignore [misc]
-        return proxy_obj
+        instance = _object_new(proxy)
+        if proxy.__setattr__ is _object_setattr:
+            instance._proxied = proxied # type: ignore [attr-defined] # pyright: ignore [reportAttributeAccessIssue]
+        else:
+            # A custom `__setattr__` may itself rely on `_proxied`, so it is bypassed, but only
+            # when it exists, since `object.__setattr__` is several times slower than a plain store.
+            _object_setattr(instance, '_proxied', proxied)
+        init = proxy.__init__
+        if init is not _no_init:
+            if args or kwargs:
+                init(instance, *args, **kwargs)
+            else:
+                # Calling without unpacking the (empty) arguments avoids the generic
+                # argument-unpacking call path.
+                init(instance)
+        return instance
 
     @staticmethod
     def get[Proxied](_: type[Proxied], proxy: Any) -> Proxied:
@@ -74,6 +192,9 @@ class Proxy:
         Retrieves the original proxied object from a proxy instance.
         This is useful when you need to access the underlying object directly.
         """
+        # A plain attribute read is specialized by the interpreter for both the
+        # instance `__dict__` and the `slots=True` layout, and is several times
+        # faster than going through `object.__getattribute__` explicitly.
         return proxy._proxied
 
     @staticmethod
@@ -82,6 +203,41 @@ class Proxy:
         Sets a new proxy object in place of the previous one.
         This is useful when you need to set the underlying object directly.
         """
-        proxy._proxied = proxied
+        # Methods cached by `proxy.bind` on instances of this class need rebinding. The lookup
+        # is skipped while `proxy.bind` was never used, as `id` allocates its result.
+        if _bound_names and (names := _bound_names.get(id(proxy.__class__))):
+            _rebind(proxy, names, proxied)
+        elif type(proxy).__setattr__ is _object_setattr:
+            proxy._proxied = proxied
+        else:
+            _object_setattr(proxy, '_proxied', proxied)
+
+    @staticmethod
+    def bind[Proxied](_: type[Proxied], proxy: Any, name: str) -> Any:
+        """
+        Retrieves the method `name` of the original proxied object, and caches it
+        on the proxy instance as `_<name>_orig`.
+
+        Binding the method once, typically in `__init__`, lets a proxy class that
+        wraps it call the original through a plain attribute read of
+        `self._<name>_orig`, rather than looking it up on the proxied object on
+        every call. Cached methods are rebound (or dropped) by `proxy.set`. Proxy instances
+        created with `slots=True` have no `__dict__`, so the method is only returned.
+        """
+        proxied = proxy._proxied
+        if not type(proxy).__dictoffset__:
+            return getattr(proxied, name)
+        cache = proxy.__dict__
+        key = f'_{name}_orig'
+        method = cache.get(key)
+        if method is None or getattr(method, '__self__', None) is not proxied:
+            method = cache[key] = getattr(proxied, name)
+            type_: type = proxy.__class__
+            names = _bound_names.get(id(type_))
+            if names is None:
+                names = _bound_names[id(type_)] = set()
+                weakref.finalize(type_, _bound_names.pop, id(type_), None)
+            names.add(name)
+        return method
 
 proxy = Proxy()
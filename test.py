@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import Mock
+from typing import Any
 from proxy import proxy
 
 class MyProxiedClass:
@@ -241,6 +242,392 @@ class TestProxy(unittest.TestCase):
         self.assertIn('name', proxy_instance.__dict__) # 'name' should now be in proxy's dict
         self.assertEqual(proxy_instance.__dict__['name'], "proxy_name")
 
+    def test_proxied_class_members_are_shadowable(self):
+        class ProxiedWithClassMembers:
+            CLASS_ATTR = "class"
+
+            def __init__(self, value):
+                self._value = value
+
+            @property
+            def value(self):
+                return self._value
+
+            def method(self):
+                return "proxied"
+
+        @proxy(ProxiedWithClassMembers)
+        class ProxyWithClassMembers(ProxiedWithClassMembers):
+            pass
+
+        proxied_instance = ProxiedWithClassMembers(1)
+        proxy_instance = proxy.create(ProxyWithClassMembers, proxied_instance)
+
+        self.assertEqual(proxy_instance.value, 1)
+        self.assertEqual(proxy_instance.method(), "proxied")
+        proxied_instance.CLASS_ATTR = "instance"
+        self.assertEqual(proxy_instance.CLASS_ATTR, "instance")
+
+        proxy_instance.method = lambda: "proxy"
+        self.assertEqual(proxy_instance.method(), "proxy")
+        self.assertEqual(proxied_instance.method(), "proxied")
+        del proxy_instance.method
+        self.assertEqual(proxy_instance.method(), "proxied")
+
+        with self.assertRaises(AttributeError):
+            proxy_instance.missing
+
+    def test_proxy_with_mixin(self):
+        class Mixin:
+            def foo(self):
+                return 'mixin'
+
+        class Proxied:
+            def foo(self):
+                return 'proxied'
+
+            def bar(self):
+                return 'proxied'
+
+        @proxy(Proxied)
+        class ProxyWithMixin(Mixin, Proxied):
+            pass
+
+        proxy_instance = proxy.create(ProxyWithMixin, Proxied())
+        self.assertEqual(proxy_instance.foo(), 'mixin')
+        self.assertEqual(proxy_instance.bar(), 'proxied')
+
+    def test_proxied_property_raising_attribute_error(self):
+        calls: list[int] = []
+
+        class Proxied:
+            @property
+            def missing(self):
+                calls.append(1)
+                raise AttributeError('missing')
+
+        for slots in (False, True):
+            @proxy(Proxied, slots=slots)
+            class ProxyForProperty(Proxied):
+                pass
+
+            calls.clear()
+            proxy_instance = proxy.create(ProxyForProperty, Proxied())
+            self.assertFalse(hasattr(proxy_instance, 'missing'))
+            self.assertEqual(len(calls), 1)
+
+    def test_proxied_methods_are_delegated(self):
+        class ProxiedWithMethods:
+            def positional_only(self, a, /, b):
+                return (a, b)
+
+            def keyword_only(self, a, *, b):
+                return (a, b)
+
+            def with_default(self, a=1):
+                return a
+
+            def variadic(self, *args, **kwargs):
+                return (args, kwargs)
+
+            @staticmethod
+            def static(a):
+                return a
+
+            @classmethod
+            def class_method(cls):
+                return cls
+
+        @proxy(ProxiedWithMethods)
+        class ProxyWithMethods(ProxiedWithMethods):
+            pass
+
+        proxy_instance = proxy.create(ProxyWithMethods, ProxiedWithMethods())
+
+        self.assertEqual(proxy_instance.positional_only(1, b=2), (1, 2))
+        self.assertEqual(proxy_instance.keyword_only(a=1, b=2), (1, 2))
+        self.assertEqual(proxy_instance.with_default(), 1)
+        self.assertEqual(proxy_instance.with_default(2), 2)
+        self.assertEqual(proxy_instance.variadic(1, b=2), ((1,), {'b': 2}))
+        self.assertEqual(proxy_instance.static(3), 3)
+        self.assertIs(proxy_instance.class_method(), ProxiedWithMethods)
+        with self.assertRaises(TypeError):
+            proxy_instance.keyword_only(1, 2)
+
+    def test_proxied_subclass_method_signature(self):
+        class Proxied:
+            def bar(self, x):
+                return ('p', x)
+
+        class ProxiedSubclass(Proxied):
+            def bar(self, x, y=0):
+                return ('q', x, y)
+
+        @proxy(Proxied)
+        class ProxyForSubclass(Proxied):
+            pass
+
+        proxy_instance = proxy.create(ProxyForSubclass, ProxiedSubclass())
+        self.assertEqual(proxy_instance.bar(1, y=2), ('q', 1, 2))
+
+    def test_proxy_direct_construction(self):
+        @proxy(MyProxiedClass)
+        class MyProxy(MyProxiedClass):
+            def __init__(self, factor):
+                self.factor = factor
+
+            def get_scaled_value(self):
+                return proxy.get(MyProxiedClass, self).get_value() * self.factor
+
+        proxied_instance = MyProxiedClass(10)
+        proxy_instance = MyProxy(3)
+        self.assertIn('factor', dir(proxy_instance))
+        proxy.set(proxy_instance, proxied_instance)
+
+        self.assertIs(proxy.get(MyProxiedClass, proxy_instance), proxied_instance)
+        self.assertEqual(proxy_instance.get_scaled_value(), 30)
+        self.assertEqual(proxy_instance.value, 10)
+
+    def test_proxy_subclass_init(self):
+        @proxy(MyProxiedClass)
+        class MyProxy(MyProxiedClass):
+            def __init__(self, factor):
+                self.factor = factor
+
+        class MyProxySubclass(MyProxy):
+            def __init__(self, factor):
+                super().__init__(factor * 2)
+
+        proxied_instance = MyProxiedClass(10)
+        proxy_instance = proxy.create(MyProxySubclass, proxied_instance, 3)
+
+        self.assertIs(proxy.get(MyProxiedClass, proxy_instance), proxied_instance)
+        self.assertEqual(proxy_instance.factor, 6)
+        self.assertEqual(proxy_instance.value, 10)
+
+    def test_proxy_with_custom_new(self):
+        @proxy(MyProxiedClass)
+        class ProxyWithNew(MyProxiedClass):
+            def __new__(cls, *args: Any, **kwargs: Any):
+                return super().__new__(cls)
+
+            def __init__(self, factor):
+                self.factor = factor
+
+        proxied_instance = MyProxiedClass(10)
+        proxy_instance = proxy.create(ProxyWithNew, proxied_instance, 3)
+        self.assertIs(proxy.get(MyProxiedClass, proxy_instance), proxied_instance)
+        self.assertEqual(proxy_instance.factor, 3)
+
+        direct_instance = ProxyWithNew(4)
+        self.assertEqual(direct_instance.factor, 4)
+
+    def test_proxy_with_slots(self):
+        @proxy(MyProxiedClass, slots=True)
+        class SlottedProxy(MyProxiedClass):
+            __slots__ = 'factor'
+
+            def __init__(self, factor):
+                self.factor = factor
+
+            def get_scaled_value(self):
+                return proxy.get(MyProxiedClass, self).get_value() * self.factor
+
+        proxied_instance = MyProxiedClass(10)
+        proxy_instance = proxy.create(SlottedProxy, proxied_instance, 2)
+
+        self.assertEqual(SlottedProxy.__dictoffset__, 0)
+        self.assertEqual(proxy_instance.get_scaled_value(), 20)
+        self.assertEqual(proxy_instance.get_value(), 10)
+        self.assertEqual(proxy_instance.value, 10)
+        self.assertIn('factor', dir(proxy_instance))
+        self.assertIn('value', dir(proxy_instance))
+        with self.assertRaises(AttributeError):
+            proxy_instance.new_proxy_attr = 123
+
+    def test_proxy_without_init_ignores_init_args(self):
+        @proxy(MyProxiedClass)
+        class ProxyWithoutInit(MyProxiedClass):
+            pass
+
+        proxy_instance = proxy.create(ProxyWithoutInit, MyProxiedClass(1))
+        self.assertEqual(proxy_instance.value, 1)
+
+        proxy_instance = proxy.create(ProxyWithoutInit, MyProxiedClass(1), 2)
+        self.assertEqual(proxy_instance.value, 1)
+        self.assertNotIn('value', vars(proxy_instance))
+
+    def test_proxy_with_intermediate_base(self):
+        class Intermediate(MyProxiedClass):
+            pass
+
+        @proxy(MyProxiedClass)
+        class ProxyWithIntermediate(Intermediate):
+            pass
+
+        proxy_instance = proxy.create(ProxyWithIntermediate, MyProxiedClass(7))
+        self.assertEqual(proxy_instance.value, 7)
+        self.assertNotIn('value', vars(proxy_instance))
+
+    def test_proxy_init_signature_is_preserved(self):
+        @proxy(MyProxiedClass)
+        class ProxyWithSignature(MyProxiedClass):
+            def __init__(self, a, b=2, *, c, d=4):
+                self.params = (a, b, c, d)
+
+        proxied_instance = MyProxiedClass(1)
+
+        self.assertEqual(proxy.create(ProxyWithSignature, proxied_instance, 1, c=3).params, (1, 2, 3, 4))
+        self.assertEqual(proxy.create(ProxyWithSignature, proxied_instance, a=1, b=5, c=3, d=6).params, (1, 5, 3, 6))
+        with self.assertRaises(TypeError):
+            proxy.create(ProxyWithSignature, proxied_instance, 1, 2, 3)
+
+    def test_proxy_with_slots_class_members(self):
+        class ProxiedWithClassMembers:
+            CLASS_ATTR = "class"
+
+            def __init__(self, value):
+                self._value = value
+
+            @property
+            def value(self):
+                return self._value
+
+            def with_default(self, a=1):
+                return a
+
+        @proxy(ProxiedWithClassMembers, slots=True)
+        class SlottedProxy(ProxiedWithClassMembers):
+            pass
+
+        proxied_instance = ProxiedWithClassMembers(1)
+        proxy_instance = proxy.create(SlottedProxy, proxied_instance)
+
+        self.assertEqual(proxy_instance.CLASS_ATTR, "class")
+        self.assertEqual(proxy_instance.value, 1)
+        self.assertEqual(proxy_instance.with_default(), 1)
+        proxied_instance.CLASS_ATTR = "instance"
+        self.assertEqual(proxy_instance.CLASS_ATTR, "instance")
+        with self.assertRaises(AttributeError):
+            proxy_instance.CLASS_ATTR = "proxy"
+
+        proxy.set(proxy_instance, object())
+        with self.assertRaises(AttributeError):
+            proxy_instance.CLASS_ATTR
+
+    def test_proxy_class_metaclass(self):
+        class PlainProxied:
+            def method(self):
+                pass
+
+        @proxy(PlainProxied)
+        class PlainProxy(PlainProxied):
+            def method(self):
+                pass
+
+        # All members of the proxied class are defined by the proxy class, no metaclass is needed
+        self.assertIs(type(PlainProxy), type)
+        self.assertIn('method', dir(PlainProxy))
+
+        @proxy(PlainProxied)
+        class DelegatingProxy(PlainProxied):
+            pass
+
+        self.assertIn('method', dir(DelegatingProxy))
+
+        class ProxiedWithSpecialMethod:
+            def __len__(self):
+                return 0
+
+        @proxy(ProxiedWithSpecialMethod)
+        class ProxyForSpecialMethod(ProxiedWithSpecialMethod):
+            pass
+
+        self.assertIn('__len__', dir(ProxyForSpecialMethod))
+
+    def test_proxy_with_custom_setattr(self):
+        class Proxied:
+            def __init__(self):
+                self.value = 0
+
+        @proxy(Proxied)
+        class ForwardingProxy(Proxied):
+            def __init__(self):
+                self.value = 1
+
+            def __setattr__(self, name: str, value: Any):
+                setattr(proxy.get(Proxied, self), name, value)
+
+        proxied = Proxied()
+        instance = proxy.create(ForwardingProxy, proxied)
+        self.assertIs(proxy.get(Proxied, instance), proxied)
+        self.assertEqual(proxied.value, 1)
+
+        other = Proxied()
+        proxy.set(instance, other)
+        self.assertIs(proxy.get(Proxied, instance), other)
+        self.assertEqual(proxied.value, 1)
+
+    def test_proxy_bind(self):
+        class Proxied:
+            def method(self):
+                return self
+
+        @proxy(Proxied)
+        class BindingProxy(Proxied):
+            _method_orig: Any
+
+            def __init__(self):
+                proxy.bind(Proxied, self, 'method')
+
+            def method(self):
+                return self._method_orig()
+
+        proxied = Proxied()
+        instance = proxy.create(BindingProxy, proxied)
+        self.assertIs(instance.method(), proxied)
+        self.assertIs(proxy.bind(Proxied, instance, 'method'), instance._method_orig)
+
+        other = Proxied()
+        proxy.set(instance, other)
+        self.assertIs(instance.method(), other)
+
+        # The bookkeeping of bound methods is not visible on the proxy
+        self.assertEqual(set(vars(instance)), {'_proxied', '_method_orig'})
+        self.assertNotIn('_proxied_bound', dir(BindingProxy))
+        unbound_instance = proxy.create(BindingProxy, proxied)
+        del unbound_instance.__dict__['_method_orig']
+        proxy.set(unbound_instance, other)
+        self.assertNotIn('_method_orig', vars(unbound_instance))
+
+        class NotAProxy:
+            pass
+
+        not_a_proxy = NotAProxy()
+        proxy.set(not_a_proxy, proxied)
+        self.assertIs(proxy.get(Proxied, not_a_proxy), proxied)
+
+        @proxy(Proxied, slots=True)
+        class SlotsBindingProxy(Proxied):
+            pass
+
+        slots_instance = proxy.create(SlotsBindingProxy, proxied)
+        self.assertIs(proxy.bind(Proxied, slots_instance, 'method')(), proxied)
+
+        # A subclass with a `__dict__` of a proxy that keeps the proxied object in a slot
+        class DictSubclassProxy(SlotsBindingProxy):
+            pass
+
+        dict_instance = proxy.create(DictSubclassProxy, proxied)
+        self.assertIs(proxy.bind(Proxied, dict_instance, 'method')(), proxied)
+        proxy.set(dict_instance, other)
+        self.assertIs(vars(dict_instance)['_method_orig'](), other)
+
+        # Setting an object without the bound method drops it instead of failing
+        proxy.set(instance, None)
+        self.assertIsNone(proxy.get(Proxied, instance))
+        self.assertNotIn('_method_orig', vars(instance))
+
 
 if __name__ == '__main__':
     unittest.main()